@@ -1,14 +1,25 @@
 import sys
 import os
+import codecs
 import json
 import platform
-import tempfile
 import re
+import struct
 import time
 import datetime
 import traceback
 import logging
-from pathlib import Path
+import functools
+import gzip
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, RotatingFileHandler
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -22,13 +33,11 @@ from PySide6.QtWidgets import (
     QPushButton,
     QListWidget,
     QListWidgetItem,
-    QHBoxLayout,
     QFrame,
-    QToolButton,
     QSplitter,
 )
-from PySide6.QtGui import QAction, QIcon
-from PySide6.QtCore import Qt, QProcess, QSize
+from PySide6.QtGui import QAction, QColor, QIcon, QKeySequence
+from PySide6.QtCore import Qt, QObject, QProcess, QSize, QTimer, Signal, Slot
 
 # Get the application's base directory - important for PyInstaller compatibility
 if getattr(sys, "frozen", False):
@@ -38,6 +47,9 @@ else:
     # If running from script
     APPLICATION_PATH = os.path.dirname(os.path.abspath(__file__))
 
+# render_script.py ships next to this script, or inside the PyInstaller bundle
+RENDER_SCRIPT = os.path.join(APPLICATION_PATH, "render_script.py")
+
 CONFIG_FILE = (
     os.path.join(APPLICATION_PATH, "config.json")
     if getattr(sys, "frozen", False)
@@ -45,44 +57,606 @@ CONFIG_FILE = (
 )
 
 
+def user_data_dir():
+    """Return the per-user folder for files the app writes at runtime"""
+    system = platform.system()
+    if system == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif system == "Darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "BlenderRenderGui")
+
+
+# Logs and caches can't live in the bundle: PyInstaller extracts it to a temp
+# folder that is deleted on exit. From source they stay in the working directory
+DATA_DIR = user_data_dir() if getattr(sys, "frozen", False) else ""
+
+# Blender's render output is logged here; set BRG_ECHO=1 to also print it
+LOG_FILE = os.path.join(DATA_DIR, "render.log")
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+ECHO_BLENDER_OUTPUT = os.environ.get("BRG_ECHO") == "1"
+
+# Probe results of recently queued files, keyed by path, mtime and size
+PROBE_CACHE_FILE = os.path.join(DATA_DIR, "probe_cache.json")
+PROBE_CACHE_SIZE = 500
+
+# Rendered frames are named <prefix><frame number>.<ext> by render_script.py
+FRAME_PREFIX = "frame_"
+
+# Sidecar written into each output directory to make resuming O(1)
+RENDER_STATE_FILE = ".render_state.json"
+
+# Values reported by the probe script, one "[PROBE] <KEY> <value>" line each
+PROBE_KEYS = ("START_FRAME", "END_FRAME", "OUTPUT_DIR", "OUTPUT_FORMAT")
+PROBE_LINE_RE = re.compile(r"\[PROBE\] (\w+) ?(.*)")
+
+# Passed to Blender with --python-expr, so no script file has to be written or shipped
+PROBE_EXPR = "; ".join(
+    (
+        "import bpy",
+        "scene = bpy.context.scene",
+        "print("
+        "f'[PROBE] START_FRAME {scene.frame_start}', "
+        "f'[PROBE] END_FRAME {scene.frame_end}', "
+        "f'[PROBE] OUTPUT_DIR {bpy.path.abspath(scene.render.filepath)}', "
+        "f'[PROBE] OUTPUT_FORMAT {scene.render.image_settings.file_format}', "
+        "sep=chr(10), flush=True)",
+        "exit()",
+    )
+)
+
+# Frame number in Blender's render status lines ("Fra:12 Mem:...")
+FRAME_LINE_RE = re.compile(r"Fra:\s*(\d+)")
+
+# Minimum time between progress widget refreshes while rendering
+PROGRESS_UPDATE_INTERVAL_MS = 100
+
+# How long notices that don't need a reply stay in the status bar
+STATUS_MESSAGE_TIMEOUT_MS = 5000
+
+# Number of recent frame times the time estimates are averaged over
+FRAME_TIME_WINDOW = 256
+
+# Cancel button look while a render can be cancelled, and while idle
+CANCEL_BUTTON_ENABLED_STYLE = (
+    "background-color: salmon; font-weight: bold; border-radius: 4px; padding: 5px;"
+)
+CANCEL_BUTTON_DISABLED_STYLE = (
+    "background-color: lightgray; border-radius: 4px; padding: 5px;"
+)
+
+# Crash recovery: restart delay doubles per crash, up to a limit, and a scene
+# that keeps crashing is given up on
+RESTART_DELAY_MS = 500
+MAX_RESTART_DELAY_MS = 30000
+MAX_CRASHES = 10
+
+# Leading bytes of compressed .blend files: gzip before Blender 3.0, zstd since
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# ImageFormatData.imtype values, mapped to the names Blender's Python API reports
+BLEND_IMAGE_FORMATS = {
+    0: "TARGA",
+    1: "IRIS",
+    4: "JPEG",
+    14: "TARGA_RAW",
+    15: "AVI_RAW",
+    16: "AVI_JPEG",
+    17: "PNG",
+    20: "BMP",
+    21: "HDR",
+    22: "TIFF",
+    23: "OPEN_EXR",
+    24: "FFMPEG",
+    26: "CINEON",
+    27: "DPX",
+    28: "OPEN_EXR_MULTILAYER",
+    30: "JPEG2000",
+}
+
+
+# Last loaded config and the config file mtime it was read at
+_CONFIG_CACHE = (None, 0)
+
+
 def load_config():
-    if not os.path.exists(CONFIG_FILE):
+    global _CONFIG_CACHE
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
         default_config = {"blender_path": ""}
         save_config(default_config)
         return default_config
-    else:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+
+    cached_config, cached_mtime = _CONFIG_CACHE
+    if cached_config is not None and cached_mtime == mtime:
+        return cached_config
+
+    with open(CONFIG_FILE, "r") as f:
+        config = json.load(f)
+    _CONFIG_CACHE = (config, mtime)
+    return config
 
 
 def save_config(data):
-    with open(CONFIG_FILE, "w") as f:
+    global _CONFIG_CACHE
+    # Write to a temporary file and swap it in so readers never see a partial file
+    temp_file = f"{CONFIG_FILE}.tmp"
+    with open(temp_file, "w") as f:
         json.dump(data, f, indent=4)
+    os.replace(temp_file, CONFIG_FILE)
+    _CONFIG_CACHE = (data, os.stat(CONFIG_FILE).st_mtime_ns)
+
+
+def load_probe_cache():
+    try:
+        with open(PROBE_CACHE_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_probe_cache(cache):
+    # Keep only the most recently probed files
+    entries = list(cache.items())[-PROBE_CACHE_SIZE:]
+    if DATA_DIR:
+        os.makedirs(DATA_DIR, exist_ok=True)
+    temp_file = f"{PROBE_CACHE_FILE}.tmp"
+    with open(temp_file, "w") as f:
+        json.dump(dict(entries), f, separators=(",", ":"))
+    os.replace(temp_file, PROBE_CACHE_FILE)
+
+
+def is_nonempty_file(path):
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1024)
+def format_clock_time(timestamp):
+    """Format a whole epoch second as local HH:MM:SS, reused across stats refreshes"""
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+
+
+@functools.lru_cache(maxsize=4096)
+def format_duration(deciseconds):
+    """Format a duration given in tenths of a second for the render statistics"""
+    seconds = deciseconds / 10
+    if seconds < 60:
+        return f"{seconds:.1f} seconds"
+    elif seconds < 3600:
+        minutes = seconds / 60
+        return f"{minutes:.1f} minutes"
+    else:
+        hours = seconds / 3600
+        return f"{hours:.1f} hours"
+
+
+def parse_sdna(data, endian):
+    """Parse a DNA1 block into struct field lists and type sizes"""
+    pos = 8  # Skip "SDNA" and "NAME"
+
+    def read_strings(pos):
+        (count,) = struct.unpack_from(f"{endian}i", data, pos)
+        pos += 4
+        strings = []
+        for _ in range(count):
+            end = data.index(b"\0", pos)
+            strings.append(data[pos:end].decode("utf-8", errors="replace"))
+            pos = end + 1
+        # Each section is aligned to 4 bytes
+        return strings, (pos + 3) & ~3
+
+    names, pos = read_strings(pos)
+    types, pos = read_strings(pos + 4)  # Skip "TYPE"
+    type_lengths = struct.unpack_from(f"{endian}{len(types)}h", data, pos + 4)
+    pos = (pos + 4 + 2 * len(types) + 3) & ~3
+
+    (struct_count,) = struct.unpack_from(f"{endian}i", data, pos + 4)
+    pos += 8
+    structs = {}
+    struct_order = []
+    for _ in range(struct_count):
+        type_index, field_count = struct.unpack_from(f"{endian}hh", data, pos)
+        pos += 4
+        fields = struct.unpack_from(f"{endian}{2 * field_count}h", data, pos)
+        pos += 4 * field_count
+        struct_name = types[type_index]
+        structs[struct_name] = [
+            (types[fields[i]], names[fields[i + 1]]) for i in range(0, len(fields), 2)
+        ]
+        struct_order.append(struct_name)
+
+    return structs, struct_order, dict(zip(types, type_lengths))
+
+
+def open_blend_file(blend_file):
+    """Open a .blend file for reading, decompressing it if Blender compressed it"""
+    f = open(blend_file, "rb")
+    magic = f.read(4)
+    if magic[:2] == GZIP_MAGIC:
+        f.close()
+        return gzip.open(blend_file, "rb")
+    if magic == ZSTD_MAGIC and zstd is not None:
+        f.close()
+        return zstd.open(blend_file, "rb")
+    f.seek(0)
+    return f
+
+
+def read_blend_scene_settings(blend_file):
+    """Read the active scene's frame range and output settings from a .blend file
+
+    Returns the same values the Blender probe script prints, keyed by PROBE_KEYS,
+    or None when the file can't be read directly (e.g. zstd-compressed files on
+    Python versions without compression.zstd).
+    """
+    with open_blend_file(blend_file) as f:
+        header = f.read(12)
+        if header[:7] != b"BLENDER":
+            return None
+
+        large_bhead = header[7:9].isdigit()
+        if large_bhead:
+            # Newer header: BLENDER<header size>-<format version>v<blender version>
+            f.seek(int(header[7:9]))
+            endian, pointer_size = "<", 8
+            bhead_format = "<4siQqq"
+        else:
+            endian = "<" if header[8:9] == b"v" else ">"
+            pointer_size = 8 if header[7:8] == b"-" else 4
+            bhead_format = f"{endian}4si{'Q' if pointer_size == 8 else 'I'}ii"
+        bhead_size = struct.calcsize(bhead_format)
+
+        # Walk the block headers in a single forward pass, reading the interesting
+        # blocks as we go so compressed files never have to seek backwards
+        scenes = {}
+        first_scene = None
+        glob_block = None
+        dna_block = None
+        while True:
+            raw = f.read(bhead_size)
+            if len(raw) < bhead_size:
+                break
+            if large_bhead:
+                code, sdna_index, old_address, length, _ = struct.unpack(
+                    bhead_format, raw
+                )
+            else:
+                code, length, old_address, sdna_index, _ = struct.unpack(
+                    bhead_format, raw
+                )
+            code = code.rstrip(b"\0")
+            if code == b"ENDB":
+                break
+
+            if code == b"SC":
+                block = (f.read(length), sdna_index)
+                scenes[old_address] = block
+                if first_scene is None:
+                    first_scene = block
+            elif code == b"GLOB":
+                glob_block = (f.read(length), sdna_index)
+            elif code == b"DNA1":
+                dna_block = (f.read(length), sdna_index)
+            else:
+                f.seek(length, os.SEEK_CUR)
+
+    if first_scene is None or dna_block is None:
+        return None
+
+    structs, struct_order, type_lengths = parse_sdna(dna_block[0], endian)
+
+    def find_field(struct_name, field):
+        offset = 0
+        for type_name, name in structs[struct_name]:
+            base_name = name.lstrip("*(").split(")")[0].split("[")[0]
+            if name.startswith(("*", "(*")):
+                size = pointer_size
+            else:
+                size = type_lengths[type_name]
+            for count in re.findall(r"\[(\d+)\]", name):
+                size *= int(count)
+            if base_name == field:
+                return offset, type_name, size
+            offset += size
+        raise KeyError(f"{struct_name}.{field}")
+
+    # The active scene is the one FileGlobal.curscene points at
+    scene_block = first_scene
+    if glob_block is not None:
+        glob, glob_sdna_index = glob_block
+        offset, _, _ = find_field(struct_order[glob_sdna_index], "curscene")
+        (curscene,) = struct.unpack_from(
+            f"{endian}{'Q' if pointer_size == 8 else 'I'}", glob, offset
+        )
+        scene_block = scenes.get(curscene, first_scene)
+
+    scene, scene_sdna_index = scene_block
+    render_offset, render_type, _ = find_field(struct_order[scene_sdna_index], "r")
+    sfra_offset, _, _ = find_field(render_type, "sfra")
+    efra_offset, _, _ = find_field(render_type, "efra")
+    pic_offset, _, pic_size = find_field(render_type, "pic")
+    format_offset, format_type, _ = find_field(render_type, "im_format")
+    imtype_offset, _, _ = find_field(format_type, "imtype")
+
+    (start_frame,) = struct.unpack_from(f"{endian}i", scene, render_offset + sfra_offset)
+    (end_frame,) = struct.unpack_from(f"{endian}i", scene, render_offset + efra_offset)
+    pic_start = render_offset + pic_offset
+    output_path = scene[pic_start : pic_start + pic_size].split(b"\0", 1)[0]
+    output_path = output_path.decode("utf-8", errors="replace")
+    imtype = scene[render_offset + format_offset + imtype_offset]
+
+    image_format = BLEND_IMAGE_FORMATS.get(imtype)
+    if image_format is None:
+        return None
+
+    # Match bpy.path.abspath, which resolves "//" against the blend file directory
+    if output_path.startswith("//"):
+        output_path = os.path.join(
+            os.path.dirname(os.path.abspath(blend_file)), output_path[2:]
+        )
+
+    return {
+        "START_FRAME": start_frame,
+        "END_FRAME": end_frame,
+        "OUTPUT_DIR": output_path,
+        "OUTPUT_FORMAT": image_format,
+    }
+
 
+class QueueEntry:
+    """A queued file's list row, with the parts of its status text that don't change"""
 
-class QueueItemWidget(QWidget):
-    def __init__(self, file_path, parent=None):
+    __slots__ = ("item", "basename", "style")
+
+    def __init__(self, item, basename):
+        self.item = item
+        self.basename = basename
+        self.style = (None, False, False)
+
+
+class StatusLabel(QLabel):
+    """Label for the frequently refreshed render status, skipping no-op updates"""
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.current_text = text
+
+    def setText(self, text):
+        # Progress refreshes often produce the same text again; don't make Qt
+        # convert and compare it, or relayout the window
+        if text == self.current_text:
+            return
+        self.current_text = text
+        super().setText(text)
+
+
+class MainThreadInvoker(QObject):
+    """Runs callbacks posted from worker threads on the GUI thread"""
+
+    invoke = Signal(object)
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.file_path = file_path
-        layout = QHBoxLayout()
-        layout.setContentsMargins(5, 2, 5, 2)
-        self.setLayout(layout)
-
-        # File path label
-        file_name = os.path.basename(file_path)
-        self.label = QLabel(f"{file_name}")
-        self.label.setToolTip(file_path)
-        layout.addWidget(self.label, 1)  # 1 = stretch factor
-
-        # Remove button
-        self.remove_btn = QToolButton()
-        self.remove_btn.setText("✕")
-        self.remove_btn.setToolTip("Remove from queue")
-        self.remove_btn.setStyleSheet(
-            "QToolButton { border: none; color: red; font-weight: bold; }"
-            "QToolButton:hover { background-color: #ffeeee; }"
+        self.invoke.connect(self.run)
+
+    @Slot(object)
+    def run(self, callback):
+        callback()
+
+
+class RenderJob:
+    """Probe and render state of one .blend file handled by a render worker"""
+
+    # Compiled frame-number pattern, keyed by image format
+    _FRAME_PATTERN_CACHE = {}
+
+    def __init__(self, blend_file):
+        self.blend_file = blend_file
+        self.basename = os.path.basename(blend_file)
+        self.process = None
+        self.probe_process = None
+        self.probe_output_lines = []
+        self.probe_cache_key = None
+        self.probe_buffer = b""
+        self.pending_probe_keys = set(PROBE_KEYS)
+
+        self.start_frame = 1
+        self.end_frame = 250
+        self.total_frames = 250
+        self.current_frame = 0
+        self.last_completed_frame = 0
+        self.missing_frames = None
+        self.output_dir = ""
+        self.image_format = "png"
+        self.crash_count = 0
+        self.restart_pending = False
+        self.stdout_buffer = ""
+        self.stdout_decoder = None
+        self.render_done = False
+
+        # Rendering time tracking
+        self.render_start_time = 0
+        self.frame_start_time = 0
+        self.frame_times = deque(maxlen=FRAME_TIME_WINDOW)
+        self.frame_time_sum = 0.0
+        self.frames_completed = 0
+
+    def record_frame_time(self, frame_time):
+        """Add a finished frame's render time, keeping a running sum of the window"""
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self.frame_time_sum -= self.frame_times[0]
+        self.frame_times.append(frame_time)
+        self.frame_time_sum += frame_time
+        self.frames_completed += 1
+
+    @classmethod
+    def get_frame_pattern(cls, image_format):
+        """Return the compiled frame-number pattern for an image format"""
+        pattern = cls._FRAME_PATTERN_CACHE.get(image_format)
+        if pattern is None:
+            # Finds the frame number in front of the extension for standard frames
+            # (shot_001.png) as well as per-eye stereoscopic images (shot_001_L.png).
+            # Used with search(), so there is no lazy prefix to backtrack over
+            pattern = re.compile(
+                rf"(\d+)(?:_[LR])?\.{re.escape(image_format)}$", re.IGNORECASE
+            )
+            cls._FRAME_PATTERN_CACHE[image_format] = pattern
+        return pattern
+
+    def load_render_state(self):
+        """Return the sidecar render state if it still describes the output directory"""
+        state_file = os.path.join(self.output_dir, RENDER_STATE_FILE)
+        try:
+            with open(state_file, "r") as f:
+                state = json.load(f)
+            # The state is stamped with the directory mtime it describes, so any
+            # frame added or removed since it was written invalidates it, finished
+            # renders included
+            if os.stat(state_file).st_mtime_ns != os.stat(self.output_dir).st_mtime_ns:
+                return None
+        except (OSError, ValueError):
+            return None
+
+        if (
+            state.get("image_format") != self.image_format
+            or state.get("end_frame") != self.end_frame
+            or state.get("start_frame", self.start_frame) > self.start_frame
+        ):
+            return None
+        return state
+
+    def save_render_state(self):
+        """Atomically write the sidecar render state into the output directory"""
+        if not self.output_dir or self.last_completed_frame < self.start_frame:
+            return
+
+        state = {
+            "start_frame": self.start_frame,
+            "last_frame": self.last_completed_frame,
+            "end_frame": self.end_frame,
+            "image_format": self.image_format,
+            "complete": self.last_completed_frame >= self.end_frame,
+        }
+        state_file = os.path.join(self.output_dir, RENDER_STATE_FILE)
+        temp_file = f"{state_file}.tmp"
+        try:
+            with open(temp_file, "w") as f:
+                json.dump(state, f)
+            os.replace(temp_file, state_file)
+            dir_mtime = os.stat(self.output_dir).st_mtime_ns
+            os.utime(state_file, ns=(dir_mtime, dir_mtime))
+        except OSError as e:
+            print(f"[WARNING] Could not write render state: {e}")
+
+    def adjust_start_frame_based_on_existing_output(self):
+        self.missing_frames = None
+        if not self.output_dir:
+            return
+
+        state = self.load_render_state()
+        if state is not None:
+            self.start_frame = max(self.start_frame, state["last_frame"] + 1)
+            self.total_frames = max(0, self.end_frame - self.start_frame + 1)
+            print(
+                f"Resuming from render state: start frame {self.start_frame}, {self.total_frames} frames to render"
+            )
+            return
+
+        extension = f".{self.image_format.lower()}"
+        frame_pattern = self.get_frame_pattern(self.image_format)
+
+        # Find the existing frame numbers within the scene's range in a single pass
+        # over the directory, stopping early once every frame has been seen
+        frames_needed = self.end_frame - self.start_frame + 1
+        rendered_frames = set()
+        try:
+            entries = os.scandir(self.output_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                filename = entry.name
+                # Cheap exact-case check first, lowercasing only for odd names
+                if not (
+                    filename.endswith(extension)
+                    or filename.lower().endswith(extension)
+                ):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    continue
+
+                # Fast path for the names written by render_script, including the
+                # per-eye stereo views (frame_00001.png, frame_00001_L.png)
+                frame_num = None
+                if filename.startswith(FRAME_PREFIX):
+                    digits = filename[len(FRAME_PREFIX) : -len(extension)]
+                    if digits.endswith(("_L", "_R")):
+                        digits = digits[:-2]
+                    if digits.isdecimal():
+                        frame_num = int(digits)
+
+                if frame_num is None:
+                    match = frame_pattern.search(filename)
+                    if match:
+                        frame_num = int(match.group(1))
+
+                if frame_num is None or not (
+                    self.start_frame <= frame_num <= self.end_frame
+                ):
+                    continue
+                rendered_frames.add(frame_num)
+                if len(rendered_frames) == frames_needed:
+                    break
+
+        # Quick check if we have any rendered frames
+        if not rendered_frames:
+            return
+
+        # Rather than just taking the max frame, we need to find missing frames.
+        # Only in-range frames were collected, so a full set means none are missing
+        if len(rendered_frames) == frames_needed:
+            missing_frames = set()
+        else:
+            missing_frames = set(range(self.start_frame, self.end_frame + 1))
+            missing_frames.difference_update(rendered_frames)
+
+        # Now we can determine what to do based on missing frames
+        if not missing_frames:
+            # If there are no missing frames, all frames are rendered
+            self.start_frame = self.end_frame + 1
+            print("All frames already rendered")
+        else:
+            # Set start frame to the first missing frame
+            first_missing = min(missing_frames)
+            last_missing = max(missing_frames)
+            self.start_frame = first_missing
+            print(
+                f"Found {len(missing_frames)} missing frames. Start rendering from frame {self.start_frame}"
+            )
+
+            # If there are multiple non-consecutive missing frames, we'll need to pass this info to render_script
+            if last_missing - first_missing + 1 != len(missing_frames):
+                # Store missing frames for use in start_render, which sorts them
+                self.missing_frames = missing_frames
+                print(
+                    f"Missing frames are non-consecutive: {len(missing_frames)} frames between {first_missing} and {last_missing}"
+                )
+            else:
+                self.missing_frames = None
+
+        # Update total frames to render
+        self.total_frames = max(0, self.end_frame - self.start_frame + 1)
+        print(
+            f"Adjusted start frame to {self.start_frame}, approximately {self.total_frames} frames to render"
         )
-        layout.addWidget(self.remove_btn)
 
 
 class DragDropWindow(QMainWindow):
@@ -93,6 +667,8 @@ class DragDropWindow(QMainWindow):
 
         self.menu_bar = self.menuBar()
         self.setup_menu()
+        # Notices that don't need a reply go here instead of a blocking dialog
+        self.status_bar = self.statusBar()
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -119,6 +695,14 @@ class DragDropWindow(QMainWindow):
         self.queue_list = QListWidget()
         self.queue_list.setMinimumHeight(150)
         self.queue_list.setAlternatingRowColors(True)
+        # Rows are plain text items; files are removed from the right-click menu
+        # or with the Delete key
+        self.queue_list.setContextMenuPolicy(Qt.ActionsContextMenu)
+        remove_action = QAction("Remove from Queue", self.queue_list)
+        remove_action.setShortcut(QKeySequence.Delete)
+        remove_action.setShortcutContext(Qt.WidgetShortcut)
+        remove_action.triggered.connect(self.remove_selected_from_queue)
+        self.queue_list.addAction(remove_action)
         queue_layout.addWidget(self.queue_list)
 
         layout.addWidget(queue_section)
@@ -127,48 +711,66 @@ class DragDropWindow(QMainWindow):
         self.progress.setValue(0)
         layout.addWidget(self.progress)
 
-        self.stats_label = QLabel("Render statistics will appear here")
+        self.stats_label = StatusLabel("Render statistics will appear here")
         self.stats_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.stats_label)
 
-        self.frame_counter = QLabel("No rendering yet.")
+        self.frame_counter = StatusLabel("No rendering yet.")
         self.frame_counter.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.frame_counter)
 
         self.cancel_button = QPushButton("Cancel Rendering")
-        self.cancel_button.setEnabled(False)
-        self.cancel_button.setStyleSheet(
-            "background-color: lightgray; border-radius: 4px; padding: 5px;"
-        )
+        self.cancel_button_enabled = None
+        self.set_cancel_button_enabled(False)
         self.cancel_button.clicked.connect(self.cancel_render)
         layout.addWidget(self.cancel_button)
 
-        self.process = None
-        self.start_frame = 1
-        self.end_frame = 250
-        self.total_frames = 250
-        self.current_frame = 0
-        self.output_dir = ""
-        self.image_format = "png"
-        self.current_blend_file = ""
-        self.crash_count = 0
-
-        self.probe_process = None
-        self._probe_script_path = ""
+        self.ensured_output_dirs = set()
+        self.progress_changed = False
+
+        # Coalesces bursts of frame updates into at most one repaint per interval
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.timeout.connect(self.update_progress_display)
+
+        # Buffer Blender's output and write it to the log file in batches
+        self.blender_log = logging.getLogger("blender")
+        if not self.blender_log.handlers:
+            self.blender_log.setLevel(logging.DEBUG)
+            self.blender_log.propagate = False
+            if DATA_DIR:
+                os.makedirs(DATA_DIR, exist_ok=True)
+            file_handler = RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUPS,
+                encoding="utf-8",
+                delay=True,
+            )
+            self.blender_log.addHandler(
+                MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+            )
 
         # File queue management
-        self.file_queue = []
+        self.file_queue = deque()
         self.queue_items = {}  # Dictionary to track all queue items by file path
-        self.currently_rendering = False
-
-        # Rendering time tracking
-        self.render_start_time = 0
-        self.frame_start_time = 0
-        self.frame_times = []
 
         self.config = load_config()
+        self.probe_cache = load_probe_cache()
+        self.probe_cache_changed = False
+
+        # Reading .blend files and scanning output folders can be slow on network
+        # drives, so that work runs on a thread pool and reports back to the GUI thread
+        self.io_pool = ThreadPoolExecutor(max_workers=2)
+        self.main_thread = MainThreadInvoker(self)
+        self.checked_blender_path = None
+        self.blender_path_valid = False
         self.check_blender_installation()
 
+        # Render workers, keyed by the .blend file each one is probing or rendering
+        self.active_jobs = {}
+        self.max_workers = max(1, int(self.config.get("render_workers", 1)))
+
         self.is_windows = platform.system() == "Windows"
         self.is_macos = platform.system() == "Darwin"
 
@@ -189,22 +791,36 @@ class DragDropWindow(QMainWindow):
         filter_text = (
             "Blender Executable (*.exe)" if self.is_windows else "Blender App (*.app)"
         )
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Blender Executable", "", filter_text
-        )
+        # Open the dialog window-modally and handle the choice from its signal,
+        # instead of running a nested event loop until it closes
+        dialog = QFileDialog(self, "Select Blender Executable", "", filter_text)
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self.blender_path_selected)
+        dialog.open()
+
+    def blender_path_selected(self, path):
         if path:
             if self.is_macos and path.endswith(".app"):
                 path = os.path.join(path, "Contents", "MacOS", "Blender")
-            self.config["blender_path"] = path
-            save_config(self.config)
-            QMessageBox.information(
-                self, "Blender Path Saved", f"Blender path:\n{path}"
+            if path != self.config.get("blender_path"):
+                self.config["blender_path"] = path
+                save_config(self.config)
+            self.status_bar.showMessage(
+                f"Blender path saved: {path}", STATUS_MESSAGE_TIMEOUT_MS
             )
+            self.checked_blender_path = None
             self.check_blender_installation()
 
     def check_blender_installation(self):
         blender_path = self.config.get("blender_path", "")
-        if not blender_path or not os.path.exists(blender_path):
+        # The result only changes when a new path is chosen, so cache it per path
+        if self.checked_blender_path != blender_path:
+            self.blender_path_valid = bool(blender_path) and os.path.isfile(
+                blender_path
+            )
+            self.checked_blender_path = blender_path
+        if not self.blender_path_valid:
             self.label.setText("Setup Blender path first!")
             self.setAcceptDrops(False)
         else:
@@ -219,36 +835,45 @@ class DragDropWindow(QMainWindow):
 
     def dropEvent(self, event):
         if not self.acceptDrops():
-            QMessageBox.warning(
-                self, "Setup Required", "Please setup a valid Blender path first!"
+            self.status_bar.showMessage(
+                "Please setup a valid Blender path first!", STATUS_MESSAGE_TIMEOUT_MS
             )
             return
 
         if event.mimeData().hasUrls():
             dropped_files = [url.toLocalFile() for url in event.mimeData().urls()]
-            blend_files = [f for f in dropped_files if f.endswith(".blend")]
+            # Empty files can't be opened by Blender, so don't queue them at all.
+            # A file listed twice in one drop is only checked and queued once
+            blend_files = [
+                f
+                for f in dict.fromkeys(dropped_files)
+                if f.endswith(".blend") and is_nonempty_file(f)
+            ]
 
             if not blend_files:
-                QMessageBox.warning(
-                    self, "Invalid Files", "Please drop valid .blend files."
+                self.status_bar.showMessage(
+                    "Please drop valid .blend files.", STATUS_MESSAGE_TIMEOUT_MS
                 )
                 return
 
-            # Add files to queue
-            for blend_file in blend_files:
-                self.add_file_to_queue(blend_file)
+            # Add files to queue, repainting the list once for the whole drop
+            self.queue_list.setUpdatesEnabled(False)
+            try:
+                for blend_file in blend_files:
+                    self.add_file_to_queue(blend_file)
+            finally:
+                self.queue_list.setUpdatesEnabled(True)
 
             # If this is a new batch after previous completion, reset overall statistics
             if (
-                not self.currently_rendering
+                not self.active_jobs
                 and self.total_scenes_rendered > 0
                 and not self.file_queue
             ):
                 self.reset_overall_statistics()
 
-            # Start processing if not already rendering
-            if not self.currently_rendering:
-                self.process_next_file()
+            # Start processing on any idle render workers
+            self.process_next_file()
         else:
             event.ignore()
 
@@ -260,64 +885,44 @@ class DragDropWindow(QMainWindow):
         self.session_start_time = time.time()
 
     def add_file_to_queue(self, blend_file):
-        # Check if file is already in queue
-        existing_item = None
-        already_queued = False
-
         # Check if this file has already been queued
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            widget = self.queue_list.itemWidget(item)
-            if widget and widget.file_path == blend_file:
-                # Found existing item for this file
-                already_queued = True
-                existing_item = item
-
-        if already_queued:
+        if blend_file in self.queue_items:
             # File already queued, update status if not currently rendering
-            widget = self.queue_list.itemWidget(existing_item)
-            if self.current_blend_file != blend_file:
+            if blend_file not in self.active_jobs:
                 if blend_file not in self.file_queue:
                     # Add to queue if not already there
                     self.file_queue.append(blend_file)
                     status_text = (
-                        "Ready to render" if not self.currently_rendering else "Queued"
-                    )
-                    widget.label.setText(
-                        f"{os.path.basename(blend_file)} ({status_text})"
+                        "Ready to render" if not self.active_jobs else "Queued"
                     )
                     # Reset styling
-                    widget.label.setStyleSheet("")
+                    self.set_queue_status(blend_file, status_text)
             return
 
         # Add to internal queue
         self.file_queue.append(blend_file)
 
-        # Create and add queue item widget
-        item_widget = QueueItemWidget(blend_file)
-        item = QListWidgetItem(self.queue_list)
-        item.setSizeHint(item_widget.sizeHint())
+        # Add a plain list item, keeping the full path for removal and the tooltip
+        basename = os.path.basename(blend_file)
+        status_text = "Ready to render" if not self.active_jobs else "Queued"
+        item = QListWidgetItem(f"{basename} ({status_text})")
+        item.setData(Qt.UserRole, blend_file)
+        item.setToolTip(blend_file)
         self.queue_list.addItem(item)
-        self.queue_list.setItemWidget(item, item_widget)
 
-        # Store reference to item in our tracking dictionary
-        self.queue_items[blend_file] = item
+        # Store a reference to the item in our tracking dictionary
+        self.queue_items[blend_file] = QueueEntry(item, basename)
 
-        # Connect remove button to remove function
-        item_widget.remove_btn.clicked.connect(
-            lambda: self.remove_file_from_queue(item, blend_file)
-        )
-
-        # Update UI
-        status_text = "Ready to render" if not self.currently_rendering else "Queued"
-        item_widget.label.setText(f"{os.path.basename(blend_file)} ({status_text})")
+    def remove_selected_from_queue(self):
+        item = self.queue_list.currentItem()
+        if item is not None:
+            self.remove_file_from_queue(item, item.data(Qt.UserRole))
 
     def remove_file_from_queue(self, item, blend_file):
-        if blend_file == self.current_blend_file and self.currently_rendering:
-            QMessageBox.warning(
-                self,
-                "File In Use",
-                f"Cannot remove {os.path.basename(blend_file)} while it's being rendered.",
+        if blend_file in self.active_jobs:
+            self.status_bar.showMessage(
+                f"Cannot remove {self.queue_items[blend_file].basename} while it's being rendered.",
+                STATUS_MESSAGE_TIMEOUT_MS,
             )
             return
 
@@ -332,369 +937,441 @@ class DragDropWindow(QMainWindow):
         if blend_file in self.queue_items:
             del self.queue_items[blend_file]
 
+    def set_cancel_button_enabled(self, enabled):
+        """Enable or disable the cancel button, restyling it only when that changes"""
+        if enabled == self.cancel_button_enabled:
+            return
+        self.cancel_button_enabled = enabled
+        self.cancel_button.setEnabled(enabled)
+        self.cancel_button.setStyleSheet(
+            CANCEL_BUTTON_ENABLED_STYLE if enabled else CANCEL_BUTTON_DISABLED_STYLE
+        )
+
+    def set_queue_status(
+        self, blend_file, status, color=None, bold=False, italic=False
+    ):
+        """Show a status next to a file in the queue list"""
+        entry = self.queue_items.get(blend_file)
+        if entry is None:
+            return
+        # Item data only repaints the row, unlike the label stylesheets this replaced
+        entry.item.setText(f"{entry.basename} ({status})")
+        # Building the colour and font is skipped while the style stays the same
+        style = (color, bold, italic)
+        if style != entry.style:
+            entry.style = style
+            entry.item.setData(Qt.ForegroundRole, QColor(color) if color else None)
+            font = entry.item.font()
+            font.setBold(bold)
+            font.setItalic(italic)
+            entry.item.setFont(font)
+
     def process_next_file(self):
-        if not self.file_queue:
-            self.currently_rendering = False
+        # Hand queued files to every idle render worker
+        while self.file_queue and len(self.active_jobs) < self.max_workers:
+            next_file = self.file_queue.popleft()
+            job = RenderJob(next_file)
+            self.active_jobs[next_file] = job
+
+            # Update UI to show which file is now rendering
+            self.set_queue_status(
+                next_file,
+                "Rendering...",
+                "green",
+                bold=True,
+            )
+
+            self.probe_scene(job)
+
+        if not self.active_jobs:
             self.label.setText("Drag one or more Blender files here")
 
+            if self.probe_cache_changed:
+                try:
+                    save_probe_cache(self.probe_cache)
+                except OSError as e:
+                    print(f"Could not save probe cache: {e}")
+                self.probe_cache_changed = False
+
             # If we've rendered at least one scene, display overall statistics
             if self.total_scenes_rendered > 0:
                 self.display_overall_statistics()
-            return
 
-        self.currently_rendering = True
-        next_file = self.file_queue[0]
-        self.file_queue.pop(0)
+    def is_active_job(self, job):
+        """Check if a job is still being worked on, i.e. it wasn't cancelled or finished"""
+        return self.active_jobs.get(job.blend_file) is job
 
-        # Update UI to show which file is now rendering
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            widget = self.queue_list.itemWidget(item)
-            if widget and widget.file_path == next_file:
-                widget.label.setText(f"{os.path.basename(next_file)} (Rendering...)")
-                widget.label.setStyleSheet("font-weight: bold; color: green;")
-                break
+    def rendering_jobs(self):
+        """Return the active jobs whose render has started"""
+        return [job for job in self.active_jobs.values() if job.render_start_time]
 
-        self.probe_scene(next_file)
-
-    def probe_scene(self, blend_file):
-        self._probe_script_path = tempfile.NamedTemporaryFile(
-            delete=False, suffix=".py", mode="w", encoding="utf8"
-        ).name
-        with open(self._probe_script_path, "w", encoding="utf8") as f:
-            f.write(
-                """
-import bpy
-print("[PROBE] START_FRAME", bpy.context.scene.frame_start)
-print("[PROBE] END_FRAME", bpy.context.scene.frame_end)
-print("[PROBE] OUTPUT_DIR", bpy.path.abspath(bpy.context.scene.render.filepath))
-print("[PROBE] OUTPUT_FORMAT", bpy.context.scene.render.image_settings.file_format)
-exit()
-"""
+    def probe_scene(self, job):
+        # Reuse the settings probed last time if the file hasn't changed since
+        try:
+            stat = os.stat(job.blend_file)
+            job.probe_cache_key = (
+                f"{os.path.abspath(job.blend_file)}|{stat.st_mtime_ns}|{stat.st_size}"
             )
+        except OSError:
+            job.probe_cache_key = None
+        cached_lines = self.probe_cache.get(job.probe_cache_key)
+        if cached_lines is not None:
+            job.probe_output_lines = list(cached_lines)
+            self.parse_probe_output(job)
+            return
 
-        self.probe_output_lines = []
+        # Read the scene settings straight from the .blend file, without Blender
+        self.run_in_background(
+            lambda: read_blend_scene_settings(job.blend_file),
+            lambda settings, error: self.fast_probe_finished(job, settings, error),
+        )
+
+    def run_in_background(self, work, callback):
+        """Run work on the I/O thread pool and hand its result and exception to callback on the GUI thread"""
+
+        def task():
+            try:
+                result, error = work(), None
+            except Exception as e:
+                result, error = None, e
+            self.main_thread.invoke.emit(lambda: callback(result, error))
+
+        self.io_pool.submit(task)
+
+    def fast_probe_finished(self, job, settings, error):
+        # The job may have been cancelled while its file was being read
+        if not self.is_active_job(job):
+            return
+
+        if error is not None:
+            print(f"[PROBE] Could not read {job.blend_file} directly: {error}")
+        if settings is None:
+            self.probe_scene_with_blender(job)
+            return
+
+        job.probe_output_lines = [
+            f"[PROBE] {key} {settings[key]}" for key in PROBE_KEYS
+        ]
+        for line in job.probe_output_lines:
+            print("[PROBE]", line)
+        self.cache_probe_result(job)
+        self.parse_probe_output(job)
+
+    def probe_scene_with_blender(self, job):
         blender_path = self.config.get("blender_path", "")
-        self.probe_process = QProcess(self)
-        self.probe_process.readyReadStandardOutput.connect(self.read_probe_output)
-        self.probe_process.finished.connect(lambda: self.parse_probe_output(blend_file))
+        job.probe_process = QProcess(self)
+        # Only the [PROBE] lines on stdout matter; let the OS discard stderr instead
+        # of Qt reading and buffering it for nobody
+        job.probe_process.setStandardErrorFile(QProcess.nullDevice())
+        job.probe_process.readyReadStandardOutput.connect(
+            lambda: self.read_probe_output(job)
+        )
+        job.probe_process.finished.connect(lambda: self.parse_probe_output(job))
+        job.probe_process.finished.connect(job.probe_process.deleteLater)
+
+        # The probe only reads scene settings, so skip user add-ons and scripts
+        args = [
+            "--factory-startup",
+            "--disable-autoexec",
+            "-noaudio",
+            "-b",
+            job.blend_file,
+            "--python-expr",
+            PROBE_EXPR,
+        ]
+        job.probe_process.setProgram(blender_path)
+        job.probe_process.setArguments(args)
+        job.probe_process.start()
 
-        args = ["-b", blend_file, "-P", self._probe_script_path]
-        self.probe_process.setProgram(blender_path)
-        self.probe_process.setArguments(args)
-        self.probe_process.start()
+    def cache_probe_result(self, job):
+        """Remember a complete probe result; written to disk once the queue is done"""
+        if job.probe_cache_key is None:
+            return
+        # Re-insert so the most recently probed files are the ones kept
+        self.probe_cache.pop(job.probe_cache_key, None)
+        self.probe_cache[job.probe_cache_key] = job.probe_output_lines
+        self.probe_cache_changed = True
 
-    def read_probe_output(self):
-        if not self.probe_process:
+    def read_probe_output(self, job):
+        if not job.probe_process:
             return
-        while self.probe_process.canReadLine():
-            line = bytes(self.probe_process.readLine()).decode(errors="replace").strip()
+        # Drain the output in one read, keeping an incomplete last line for later
+        job.probe_buffer += bytes(job.probe_process.readAllStandardOutput())
+        *raw_lines, job.probe_buffer = job.probe_buffer.split(b"\n")
+        for raw_line in raw_lines:
+            # Only keep (and decode) the probe lines, not Blender's startup chatter
+            if b"[PROBE]" not in raw_line:
+                continue
+            line = raw_line.decode(errors="replace").strip()
             print("[PROBE]", line)
-            self.probe_output_lines.append(line)
+            job.probe_output_lines.append(line)
+            match = PROBE_LINE_RE.match(line)
+            if match:
+                job.pending_probe_keys.discard(match.group(1))
+
+        # Everything we need has been reported, don't wait for Blender to shut down
+        if not job.pending_probe_keys:
+            self.cache_probe_result(job)
+            job.probe_process.kill()
+
+    def parse_probe_output(self, job):
+        job.probe_process = None
+        # The job may have been cancelled while Blender was probing it
+        if not self.is_active_job(job):
+            return
 
-    def parse_probe_output(self, blend_file):
-        if self._probe_script_path and os.path.exists(self._probe_script_path):
-            os.remove(self._probe_script_path)
-            self._probe_script_path = ""
+        blend_file = job.blend_file
 
         # Get the directory and basename of the blend file for creating the default output folder
-        scene_dir = os.path.dirname(blend_file)
-        scene_basename = Path(blend_file).stem
+        scene_dir, scene_name = os.path.split(blend_file)
+        scene_basename = os.path.splitext(scene_name)[0]
         fallback_output = os.path.join(scene_dir, f"{scene_basename}_output")
 
-        self.start_frame = 1
-        self.end_frame = 250
-        self.output_dir = ""
-        self.image_format = "png"
-
-        for line in self.probe_output_lines:
-            if "[PROBE] START_FRAME" in line:
-                self.start_frame = int(line.split()[-1])
-            elif "[PROBE] END_FRAME" in line:
-                self.end_frame = int(line.split()[-1])
-            elif "[PROBE] OUTPUT_DIR" in line:
-                output = line.split(" ", 2)[-1].strip()
-                # Only use the output if it's not empty and not just "//"
-                if output and output != "//" and not output.endswith("OUTPUT_DIR"):
-                    self.output_dir = output
-            elif "[PROBE] OUTPUT_FORMAT" in line:
-                fmt = line.split(" ", 2)[-1].strip()
-                if fmt:
-                    self.image_format = fmt.lower()
+        probe_values = {}
+        for line in job.probe_output_lines:
+            match = PROBE_LINE_RE.match(line)
+            if match:
+                probe_values[match.group(1)] = match.group(2).strip()
+
+        if "START_FRAME" in probe_values:
+            job.start_frame = int(probe_values["START_FRAME"])
+        if "END_FRAME" in probe_values:
+            job.end_frame = int(probe_values["END_FRAME"])
+        # Only use the output if it's not empty and not just "//"
+        output = probe_values.get("OUTPUT_DIR")
+        if output and output != "//":
+            job.output_dir = output
+        fmt = probe_values.get("OUTPUT_FORMAT")
+        if fmt:
+            job.image_format = fmt.lower()
 
         # Use the fallback (scene name + _output) if output dir is unset or just "//"
         if (
-            not self.output_dir
-            or self.output_dir == "//"
-            or self.output_dir.endswith("OUTPUT_DIR")
+            not job.output_dir
+            or job.output_dir == "//"
+            or job.output_dir.endswith("OUTPUT_DIR")
         ):
-            self.output_dir = fallback_output
+            job.output_dir = fallback_output
         else:
             # If the path starts with //, it's relative to the blend file directory
-            if self.output_dir.startswith("//"):
-                self.output_dir = os.path.normpath(
-                    os.path.join(scene_dir, self.output_dir[2:])
+            if job.output_dir.startswith("//"):
+                job.output_dir = os.path.normpath(
+                    os.path.join(scene_dir, job.output_dir[2:])
                 )
             # Ensure we have an absolute path
-            elif not os.path.isabs(self.output_dir):
-                self.output_dir = os.path.normpath(
-                    os.path.join(scene_dir, self.output_dir)
+            elif not os.path.isabs(job.output_dir):
+                job.output_dir = os.path.normpath(
+                    os.path.join(scene_dir, job.output_dir)
                 )
-            # Convert the path to an absolute path
-            self.output_dir = os.path.abspath(self.output_dir)
+            else:
+                job.output_dir = os.path.normpath(job.output_dir)
+            # Only resolve against the working directory if still relative
+            if not os.path.isabs(job.output_dir):
+                job.output_dir = os.path.abspath(job.output_dir)
+
+        job.total_frames = job.end_frame - job.start_frame + 1
+        self.run_in_background(
+            lambda: self.prepare_output_dir(job),
+            lambda _, error: self.output_dir_prepared(job, error),
+        )
 
-        try:
-            os.makedirs(self.output_dir, exist_ok=True)
-
-            # Continue with normal processing
-            self.total_frames = self.end_frame - self.start_frame + 1
-            self.adjust_start_frame_based_on_existing_output()
-
-            if self.start_frame > self.end_frame:
-                # Update UI to show this file was already rendered
-                for i in range(self.queue_list.count()):
-                    item = self.queue_list.item(i)
-                    widget = self.queue_list.itemWidget(item)
-                    if widget and widget.file_path == blend_file:
-                        widget.label.setText(
-                            f"{os.path.basename(blend_file)} (Already rendered)"
-                        )
-                        widget.label.setStyleSheet("color: gray; font-style: italic;")
-                        break
-
-                # Move to next file in queue
-                self.currently_rendering = False
-                self.process_next_file()
-                return
+    def prepare_output_dir(self, job):
+        """Create the output directory and find where to resume; runs on the I/O pool"""
+        # Only create each output directory once per session
+        if job.output_dir not in self.ensured_output_dirs:
+            os.makedirs(job.output_dir, exist_ok=True)
+            self.ensured_output_dirs.add(job.output_dir)
+
+        job.adjust_start_frame_based_on_existing_output()
 
-            self.label.setText(f"Processing {os.path.basename(blend_file)} currently")
-            self.current_blend_file = blend_file
-            self.crash_count = 0
-            self.start_render(blend_file)
+    def output_dir_prepared(self, job, error):
+        # The job may have been cancelled while its output was being scanned
+        if not self.is_active_job(job):
+            return
 
-        except (OSError, PermissionError) as e:
-            # Handle errors creating output directory
-            error_message = f"Error accessing output directory: {str(e)}"
-            self.log_error(blend_file, error_message)
+        blend_file = job.blend_file
+
+        if error is not None:
+            # Handle errors creating or reading the output directory
+            error_message = f"Error accessing output directory: {str(error)}"
+            self.log_error(blend_file, error_message, error)
 
             # Update queue status for this file
-            for i in range(self.queue_list.count()):
-                item = self.queue_list.item(i)
-                widget = self.queue_list.itemWidget(item)
-                if widget and widget.file_path == blend_file:
-                    widget.label.setText(
-                        f"{os.path.basename(blend_file)} (Failed with Error)"
-                    )
-                    widget.label.setStyleSheet("color: red; font-weight: bold;")
-                    break
+            self.set_queue_status(
+                blend_file,
+                "Failed with Error",
+                "red",
+                bold=True,
+            )
 
             # Display error in UI
             self.frame_counter.setText(f"Error: {error_message}")
 
             # Move to the next file
-            self.currently_rendering = False
+            del self.active_jobs[blend_file]
             self.process_next_file()
-
-    def adjust_start_frame_based_on_existing_output(self):
-        if not self.output_dir or not os.path.exists(self.output_dir):
-            return
-
-        # Get all image files in the output directory
-        existing_files = [
-            f
-            for f in os.listdir(self.output_dir)
-            if f.lower().endswith(f".{self.image_format.lower()}")
-        ]
-
-        if not existing_files:
-            return
-
-        # More robust pattern matching to handle different naming conventions
-        # This will handle both standard frames and stereoscopic images
-        frame_patterns = [
-            # Standard frame pattern (frame_001.png)
-            re.compile(rf".*?(\d+)\.{re.escape(self.image_format)}$", re.IGNORECASE),
-            # Left eye pattern (frame_001_L.png)
-            re.compile(rf".*?(\d+)_L\.{re.escape(self.image_format)}$", re.IGNORECASE),
-            # Right eye pattern (frame_001_R.png)
-            re.compile(rf".*?(\d+)_R\.{re.escape(self.image_format)}$", re.IGNORECASE),
-        ]
-
-        # Find all existing frame numbers
-        rendered_frames = set()
-        for filename in existing_files:
-            for pattern in frame_patterns:
-                match = pattern.match(filename)
-                if match:
-                    try:
-                        frame_num = int(match.group(1))
-                        rendered_frames.add(frame_num)
-                    except (ValueError, IndexError):
-                        continue
-
-        # Quick check if we have any rendered frames
-        if not rendered_frames:
             return
 
-        # Rather than just taking the max frame, we need to find missing frames
-        missing_frames = []
-        for frame in range(self.start_frame, self.end_frame + 1):
-            if frame not in rendered_frames:
-                missing_frames.append(frame)
-
-        # Now we can determine what to do based on missing frames
-        if not missing_frames:
-            # If there are no missing frames, all frames are rendered
-            self.start_frame = self.end_frame + 1
-            print("All frames already rendered")
-        else:
-            # Set start frame to the first missing frame
-            self.start_frame = missing_frames[0]
-            print(
-                f"Found {len(missing_frames)} missing frames. Start rendering from frame {self.start_frame}"
+        if job.start_frame > job.end_frame:
+            # Update UI to show this file was already rendered
+            self.set_queue_status(
+                blend_file,
+                "Already rendered",
+                "gray",
+                italic=True,
             )
 
-            # If there are multiple non-consecutive missing frames, we'll need to pass this info to render_script
-            if len(missing_frames) > 1 and missing_frames[-1] - missing_frames[
-                0
-            ] + 1 != len(missing_frames):
-                # Store missing frames for use in start_render
-                self.missing_frames = missing_frames
-                print(f"Missing frames are non-consecutive: {missing_frames[:10]}...")
-            else:
-                self.missing_frames = None
+            # Move to next file in queue
+            del self.active_jobs[blend_file]
+            self.process_next_file()
+            return
 
-        # Update total frames to render
-        self.total_frames = max(0, self.end_frame - self.start_frame + 1)
-        print(
-            f"Adjusted start frame to {self.start_frame}, approximately {self.total_frames} frames to render"
-        )
+        self.label.setText(f"Processing {job.basename} currently")
+        self.start_render(job)
 
-    def start_render(self, blend_file):
-        if self.process:
+    def start_render(self, job, restarting=False):
+        if job.process:
             QMessageBox.warning(self, "Render In Progress", "Already rendering!")
             return
 
-        # Initialize time tracking for this render
-        self.render_start_time = time.time()
-        self.frame_start_time = time.time()
-        self.frame_times = []
+        blend_file = job.blend_file
+
+        # Initialize time tracking for this render, keeping it across crash restarts
+        now = time.time()
+        if not restarting:
+            job.render_start_time = now
+            job.frame_times.clear()
+            job.frame_time_sum = 0.0
+            job.frames_completed = 0
+        job.frame_start_time = now
 
         blender_path = self.config.get("blender_path", "")
 
-        # PyInstaller compatibility: Get the correct path to the render script
-        if getattr(sys, "frozen", False):
-            # If running as PyInstaller bundle, extract render_script.py to a temporary location
-            render_script = os.path.join(APPLICATION_PATH, "render_script.py")
-            if not os.path.exists(render_script):
-                # If the script isn't found in the bundle, create a temporary copy
-                temp_render_script = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".py", mode="w", encoding="utf8"
-                ).name
-
-                # Extract render_script content from the bundle or embed it directly
-                try:
-                    with open(render_script, "r", encoding="utf-8") as src_file:
-                        script_content = src_file.read()
-                    with open(temp_render_script, "w", encoding="utf-8") as dest_file:
-                        dest_file.write(script_content)
-                    render_script = temp_render_script
-                    print(f"[INFO] Created temporary render script at: {render_script}")
-                except Exception as e:
-                    error_msg = f"Error extracting render script: {str(e)}"
-                    print(f"[ERROR] {error_msg}")
-                    QMessageBox.critical(self, "Render Script Error", error_msg)
-                    return
-        else:
-            # If running as Python script, use the script in the current directory
-            render_script = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "render_script.py"
-            )
+        render_script = RENDER_SCRIPT
 
         # Verify the render script exists
         if not os.path.exists(render_script):
             error_msg = f"Render script not found at: {render_script}"
             print(f"[ERROR] {error_msg}")
+            # Free the job's worker slot before the dialog waits for the user
+            self.fail_render(job, error_msg)
             QMessageBox.critical(self, "Render Script Error", error_msg)
             return
 
         print(f"[INFO] Using render script at: {render_script}")
         print(f"[INFO] Using Blender at: {blender_path}")
 
-        args = [
-            "-b",
-            blend_file,
+        # Renders use the user's preferences (GPU device, auto-run scripts, add-ons)
+        # unless "factory_startup" is set; add-ons the scenes need can then be
+        # listed under "addons" in config.json
+        args = ["-noaudio"]
+        if self.config.get("factory_startup"):
+            args.insert(0, "--factory-startup")
+        # Parallel workers share the CPU instead of each claiming every core
+        if self.max_workers > 1:
+            threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+            args.extend(["--threads", str(threads)])
+        args.extend(["-b", blend_file])
+        addons = self.config.get("addons", [])
+        if addons:
+            args.extend(["--addons", ",".join(addons)])
+        args += [
             "-P",
             render_script,
             "--",
             "--output_dir",
-            self.output_dir,
+            job.output_dir,
             "--prefix",
-            "frame_",
+            FRAME_PREFIX,
             "--resume",
             "true",
+            # Resume where this job worked out it should; the script skips the
+            # frames that already exist instead of starting after the newest one
+            "--start_frame",
+            str(job.start_frame),
         ]
+        if self.config.get("persistent_data"):
+            args.extend(["--persistent_data", "true"])
+        cycles_device = self.config.get("cycles_device")
+        if cycles_device:
+            args.extend(["--cycles_device", cycles_device])
 
         # If we detected non-consecutive missing frames, pass them to the render script
-        if (
-            hasattr(self, "missing_frames")
-            and self.missing_frames
-            and len(self.missing_frames) > 1
-        ):
+        if job.missing_frames and len(job.missing_frames) > 1:
             # Convert frame list to comma-separated string for passing as argument
-            missing_frames_str = ",".join(str(f) for f in self.missing_frames)
+            missing_frames_str = ",".join(map(str, sorted(job.missing_frames)))
             args.extend(["--missing_frames", missing_frames_str])
             print(
-                f"Passing list of {len(self.missing_frames)} missing frames to render script"
+                f"Passing list of {len(job.missing_frames)} missing frames to render script"
             )
 
         try:
-            self.process = QProcess(self)
-            self.process.setProcessChannelMode(
+            # Decode the output incrementally so characters split across reads survive
+            job.stdout_buffer = ""
+            job.stdout_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            job.render_done = False
+            process = QProcess(self)
+            job.process = process
+            process.setProcessChannelMode(
                 QProcess.MergedChannels
             )  # Merge stdout and stderr
-            self.process.setProgram(blender_path)
-            self.process.setArguments(args)
-            self.process.readyReadStandardOutput.connect(self.handle_stdout)
-            self.process.finished.connect(self.render_finished)
-            self.process.errorOccurred.connect(self.handle_process_error)
-            self.process.start()
+            process.setProgram(blender_path)
+            process.setArguments(args)
+            process.readyReadStandardOutput.connect(
+                lambda: self.handle_stdout(job, process)
+            )
+            process.finished.connect(lambda: self.render_finished(job, process))
+            process.errorOccurred.connect(
+                lambda error: self.handle_process_error(job, process, error)
+            )
+            # Each render gets a fresh QProcess, so free it once Blender has exited
+            process.finished.connect(process.deleteLater)
+            process.start()
 
             # Check if process started successfully
-            if not self.process.waitForStarted(3000):  # Wait up to 3 seconds
+            if not process.waitForStarted(3000):  # Wait up to 3 seconds
                 error_msg = f"Failed to start Blender process. Check if Blender path is correct: {blender_path}"
                 print(f"[ERROR] {error_msg}")
+                process.deleteLater()
+                self.fail_render(job, error_msg)
                 QMessageBox.critical(self, "Process Error", error_msg)
-                self.process = None
                 return
 
-            print(
-                f"[INFO] Blender process started with PID: {self.process.processId()}"
-            )
-
-            self.progress.setMinimum(0)
-            self.progress.setMaximum(self.total_frames)
-            self.progress.setValue(0)
-            self.frame_counter.setText(
-                f"Rendering frames {self.start_frame}-{self.end_frame}"
-            )
-            self.current_frame = self.start_frame
-            self.cancel_button.setEnabled(True)
-            self.cancel_button.setStyleSheet(
-                "background-color: salmon; font-weight: bold; border-radius: 4px; padding: 5px;"
-            )
+            print(f"[INFO] Blender process started with PID: {process.processId()}")
+
+            # A restarted render resumes where it crashed, so keep its progress
+            if not restarting:
+                job.current_frame = job.start_frame
+                job.last_completed_frame = job.start_frame - 1
+                rendering_jobs = self.rendering_jobs()
+                self.progress.setMinimum(0)
+                self.progress.setMaximum(sum(j.total_frames for j in rendering_jobs))
+                self.progress.setValue(
+                    sum(j.current_frame - j.start_frame for j in rendering_jobs)
+                )
+                self.frame_counter.setText(
+                    f"Rendering frames {job.start_frame}-{job.end_frame}"
+                )
+            self.set_cancel_button_enabled(True)
         except Exception as e:
             error_msg = f"Error starting render process: {str(e)}"
             print(f"[ERROR] {error_msg}")
             print(traceback.format_exc())
+            # Don't leave a Blender running that nothing listens to any more
+            if job.process:
+                job.process.kill()
+            self.fail_render(job, error_msg)
             QMessageBox.critical(self, "Process Error", error_msg)
-            self.process = None
 
-    def handle_process_error(self, error):
+    def handle_process_error(self, job, process, error):
         """Handle QProcess errors"""
+        # Ignore processes that were already finished or cancelled
+        if process is not job.process:
+            return
+
         error_messages = {
             QProcess.FailedToStart: "Failed to start Blender. Check if the Blender path is correct and accessible.",
-            QProcess.Crashed: f"Blender process crashed at frame {self.current_frame}.",
+            QProcess.Crashed: f"Blender process crashed at frame {job.current_frame}.",
             QProcess.Timedout: "Blender process timed out.",
             QProcess.WriteError: "Error writing to Blender process.",
             QProcess.ReadError: "Error reading from Blender process.",
@@ -708,98 +1385,171 @@ exit()
 
         # For crashed processes, try to restart rendering
         if error == QProcess.Crashed:
-            self.crash_count += 1
+            job.crash_count += 1
             print(
-                f"[INFO] Blender crashed {self.crash_count} times. Attempting to restart from frame {self.current_frame}."
+                f"[INFO] Blender crashed {job.crash_count} times. Attempting to restart from frame {job.current_frame}."
             )
-            # Logic to restart rendering could be added here
 
-    def handle_stdout(self):
-        # Check if process exists and is still running before trying to read from it
-        if self.process is None or self.process.state() != QProcess.Running:
+    def schedule_render_restart(self, job):
+        """Restart a crashed render after a backoff delay, or give up on the scene"""
+        job.save_render_state()
+        self.flush_blender_log()
+        job.process = None
+
+        if job.crash_count >= MAX_CRASHES:
+            error_message = f"Blender crashed {job.crash_count} times, giving up at frame {job.current_frame}"
+            # Keep the queue moving while the user reads the message
+            self.fail_render(job, error_message)
+            QMessageBox.warning(self, "Render Failed", error_message)
             return
 
-        try:
-            # Only read lines while the process is still running and has data
-            while (
-                self.process is not None
-                and self.process.state() == QProcess.Running
-                and self.process.canReadLine()
-            ):
-                line = bytes(self.process.readLine()).decode(errors="replace").strip()
-                print(line)
-                if "Fra:" in line:
-                    try:
-                        fra_index = line.find("Fra:")
-                        rest = line[fra_index + 4 :]
-                        frame_num_str = rest.split()[0]
-                        frame_num = int(frame_num_str)
-
-                        # If frame number changed, record frame time
-                        if self.current_frame != frame_num:
-                            if self.current_frame > 0:  # Not first frame
-                                # Record the time for previous frame
-                                frame_time = time.time() - self.frame_start_time
-                                self.frame_times.append(frame_time)
-
-                            # Start timing for new frame
-                            self.frame_start_time = time.time()
-                            self.current_frame = frame_num
-
-                        progress = self.current_frame - self.start_frame
-                        self.progress.setValue(progress)
-                        self.frame_counter.setText(
-                            f"Rendering frame {self.current_frame}/{self.end_frame} | Crashes: {self.crash_count}"
-                        )
-
-                        # Update time statistics
-                        self.update_time_statistics()
-                    except Exception as e:
-                        print(f"[ERROR parsing Fra:]: {e}")
-                if "[DONE]" in line:
-                    # Call render_finished only if process still exists
-                    if self.process is not None:
-                        self.render_finished()
-        except Exception as e:
-            # More descriptive error message with less alarmist language
-            print(f"Error while reading process output: {e}")
-            # Continue execution - don't let this error stop the application
+        # handle_process_error has already counted this crash, so the first
+        # restart waits RESTART_DELAY_MS and each further crash doubles it
+        backoff = max(0, job.crash_count - 1)
+        delay = min(MAX_RESTART_DELAY_MS, RESTART_DELAY_MS << backoff)
+        self.frame_counter.setText(
+            f"Blender crashed at frame {job.current_frame}, restarting in {delay / 1000:.1f}s | Crashes: {job.crash_count}"
+        )
+        job.restart_pending = True
+        QTimer.singleShot(delay, lambda: self.restart_render(job))
+
+    def fail_render(self, job, error_message):
+        """Give up on a job's render: log why, mark it failed and move the queue on"""
+        self.log_error(job.blend_file, error_message)
+        self.set_queue_status(job.blend_file, "Failed with Error", "red", bold=True)
+        self.frame_counter.setText(f"Error: {error_message}")
+
+        job.process = None
+        del self.active_jobs[job.blend_file]
+        if self.rendering_jobs():
+            # Rescale the progress bar to the renders that are still running
+            self.progress_changed = True
+            if not self.progress_timer.isActive():
+                self.progress_timer.start(PROGRESS_UPDATE_INTERVAL_MS)
+        else:
+            self.set_cancel_button_enabled(False)
+
+        self.process_next_file()
+
+    def restart_render(self, job):
+        # The render may have been cancelled while waiting to restart
+        if not job.restart_pending or not self.is_active_job(job):
+            return
+        job.restart_pending = False
+        print(
+            f"[INFO] Restarting render of {job.blend_file} from frame {job.current_frame}"
+        )
+        self.start_render(job, restarting=True)
+
+    def handle_stdout(self, job, process):
+        if process is not job.process:
+            return
+
+        # Drain everything Blender has written so far in one read and keep any
+        # incomplete trailing line for the next readyRead signal
+        data = process.readAllStandardOutput()
+        if not data:
+            return
+        job.stdout_buffer += job.stdout_decoder.decode(bytes(data))
+        # The finished signal ends the render; this only notes that the render
+        # script got through every frame, in case Blender crashes while quitting
+        if not job.render_done and "[DONE]" in job.stdout_buffer:
+            job.render_done = True
+        *lines, job.stdout_buffer = job.stdout_buffer.split("\n")
+        for line in lines:
+            self.handle_output_line(job, line.strip())
+
+        # Refresh the widgets with the newest frame only, once the interval elapses
+        if self.progress_changed and not self.progress_timer.isActive():
+            self.progress_timer.start(PROGRESS_UPDATE_INTERVAL_MS)
+
+    def handle_output_line(self, job, line):
+        # Parallel renders share the log, so tag each line with its scene
+        self.blender_log.debug("%s: %s", job.basename, line)
+        if ECHO_BLENDER_OUTPUT:
+            print(line)
+        # Most of Blender's output is not a frame line, skip those without the regex
+        if "Fra:" not in line:
+            return
+        match = FRAME_LINE_RE.search(line)
+        if match:
+            frame_num = int(match.group(1))
+
+            # If frame number changed, record frame time
+            if job.current_frame != frame_num:
+                now = time.time()
+                if job.current_frame > 0:  # Not first frame
+                    # Record the time for previous frame
+                    job.record_frame_time(now - job.frame_start_time)
+                    job.last_completed_frame = job.current_frame
+
+                # Start timing for new frame
+                job.frame_start_time = now
+                job.current_frame = frame_num
+
+            self.progress_changed = True
+
+    def update_progress_display(self):
+        rendering_jobs = self.rendering_jobs()
+        # Nothing new, or every render finished before the timer fired
+        if not self.progress_changed or not rendering_jobs:
+            return
+        self.progress_changed = False
+
+        # The progress bar covers the frames of every running render
+        self.progress.setMaximum(sum(job.total_frames for job in rendering_jobs))
+        self.progress.setValue(
+            sum(job.current_frame - job.start_frame for job in rendering_jobs)
+        )
+        if len(rendering_jobs) == 1:
+            job = rendering_jobs[0]
+            self.frame_counter.setText(
+                f"Rendering frame {job.current_frame}/{job.end_frame} | Crashes: {job.crash_count}"
+            )
+        else:
+            self.frame_counter.setText(
+                "\n".join(
+                    f"{job.basename}: frame {job.current_frame}/{job.end_frame} | Crashes: {job.crash_count}"
+                    for job in rendering_jobs
+                )
+            )
+
+        # Update time statistics
+        self.update_time_statistics()
 
     def update_time_statistics(self):
+        rendering_jobs = self.rendering_jobs()
+        frames_done = sum(job.frames_completed for job in rendering_jobs)
+
         # Need at least one completed frame for calculations
-        if not self.frame_times:
+        if not frames_done:
             self.stats_label.setText("Calculating render statistics...")
             return
 
-        # Calculate averages and estimates
-        avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-        elapsed_time = time.time() - self.render_start_time
+        # Calculate averages and estimates, over the most recent frames only so
+        # slow warm-up frames stop skewing the estimate
+        avg_frame_time = sum(job.frame_time_sum for job in rendering_jobs) / sum(
+            len(job.frame_times) for job in rendering_jobs
+        )
+        now = time.time()
+        elapsed_time = now - min(job.render_start_time for job in rendering_jobs)
 
-        # Estimate remaining time
-        frames_done = len(self.frame_times)
-        frames_remaining = self.total_frames - frames_done
-        estimated_remaining_seconds = frames_remaining * avg_frame_time
+        # Estimate remaining time, with the workers sharing the remaining frames
+        frames_remaining = sum(
+            job.total_frames - job.frames_completed for job in rendering_jobs
+        )
+        estimated_remaining_seconds = (
+            frames_remaining * avg_frame_time / len(rendering_jobs)
+        )
 
         # Format times for display
-        def format_time(seconds):
-            if seconds < 60:
-                return f"{seconds:.1f} seconds"
-            elif seconds < 3600:
-                minutes = seconds / 60
-                return f"{minutes:.1f} minutes"
-            else:
-                hours = seconds / 3600
-                return f"{hours:.1f} hours"
-
-        elapsed_str = format_time(elapsed_time)
-        remaining_str = format_time(estimated_remaining_seconds)
-        avg_frame_str = format_time(avg_frame_time)
+        elapsed_str = format_duration(round(elapsed_time * 10))
+        remaining_str = format_duration(round(estimated_remaining_seconds * 10))
+        avg_frame_str = format_duration(round(avg_frame_time * 10))
 
         # Estimate completion time
-        completion_time = time.time() + estimated_remaining_seconds
-        completion_time_str = datetime.datetime.fromtimestamp(completion_time).strftime(
-            "%H:%M:%S"
-        )
+        completion_time = now + estimated_remaining_seconds
+        completion_time_str = format_clock_time(int(completion_time))
 
         # Update statistics label
         stats = (
@@ -812,16 +1562,40 @@ exit()
 
         self.stats_label.setText(stats)
 
-    def render_finished(self):
-        if not self.process:
+    def render_finished(self, job, process):
+        # Ignore processes that were already finished or cancelled
+        if job.process is None or process is not job.process:
+            return
+
+        # A crash after the render script reported [DONE] happened while quitting
+        if process.exitStatus() == QProcess.CrashExit and not job.render_done:
+            self.schedule_render_restart(job)
+            return
+
+        self.flush_blender_log()
+
+        # Only a render script that got through every frame, and a Blender that
+        # then quit cleanly (or crashed while quitting), means the scene is done.
+        # Anything else, like a failed frame or a scene that didn't load, must
+        # not be recorded as complete or later drops would skip the scene
+        finished_cleanly = job.render_done and (
+            process.exitStatus() == QProcess.CrashExit or process.exitCode() == 0
+        )
+        if not finished_cleanly:
+            job.save_render_state()
+            self.fail_render(
+                job,
+                f"Blender exited with code {process.exitCode()} before finishing the render, at frame {job.current_frame}",
+            )
             return
 
-        self.progress.setValue(self.progress.maximum())
+        job.last_completed_frame = job.end_frame
+        job.save_render_state()
 
         # Calculate total render time for this scene
-        total_render_time = time.time() - self.render_start_time
+        total_render_time = time.time() - job.render_start_time
         formatted_time = self.format_time_short(total_render_time)
-        frames_rendered = self.end_frame - self.start_frame + 1
+        frames_rendered = job.end_frame - job.start_frame + 1
 
         # Update overall statistics
         self.total_scenes_rendered += 1
@@ -829,63 +1603,62 @@ exit()
         self.total_render_time += total_render_time
 
         # Update status for the completed file in the queue list with detailed stats
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            widget = self.queue_list.itemWidget(item)
-            if widget and widget.file_path == self.current_blend_file:
-                widget.label.setText(
-                    f"{os.path.basename(self.current_blend_file)} (Completed - {frames_rendered} frames, {formatted_time}, {self.crash_count} crashes)"
-                )
-                widget.label.setStyleSheet("color: blue;")
-                break
+        self.set_queue_status(
+            job.blend_file,
+            f"Completed - {frames_rendered} frames, {formatted_time}, {job.crash_count} crashes",
+            "blue",
+        )
 
         # Display scene-specific completion info
         self.frame_counter.setText(
-            f"Rendering finished!\n\n{frames_rendered} frames rendered to:\n{self.output_dir}\nCrashes: {self.crash_count}"
+            f"Rendering finished!\n\n{frames_rendered} frames rendered to:\n{job.output_dir}\nCrashes: {job.crash_count}"
         )
 
-        self.cancel_button.setEnabled(False)
-        self.cancel_button.setStyleSheet(
-            "background-color: lightgray; border-radius: 4px; padding: 5px;"
-        )
+        job.process = None
+        del self.active_jobs[job.blend_file]
 
-        self.process = None
-        self.currently_rendering = False
+        if self.rendering_jobs():
+            # Rescale the progress bar to the renders that are still running
+            self.progress_changed = True
+            if not self.progress_timer.isActive():
+                self.progress_timer.start(PROGRESS_UPDATE_INTERVAL_MS)
+        else:
+            self.progress.setValue(self.progress.maximum())
+            self.set_cancel_button_enabled(False)
 
-        # Process next file in queue if any
+        # Process next file in queue if any; once the queue is empty this also
+        # shows the overall statistics, since at least this scene was rendered
         self.process_next_file()
 
-        # If no more files to render, display overall statistics
-        if not self.currently_rendering:
-            self.label.setText("Drag one or more Blender files here")
-            self.display_overall_statistics()
-
     def cancel_render(self):
-        if self.process:
-            self.process.kill()
-            self.process = None
-            self.cancel_button.setEnabled(False)
-            self.cancel_button.setStyleSheet(
-                "background-color: lightgray; border-radius: 4px; padding: 5px;"
-            )
-            self.label.setText("Drag one or more Blender files here")
-            self.frame_counter.setText("Rendering cancelled.")
+        if not self.rendering_jobs():
+            return
+
+        # Cancel every running render, as well as files still being probed
+        for job in self.active_jobs.values():
+            job.restart_pending = False
+            if job.probe_process:
+                job.probe_process.kill()
+            if job.process:
+                job.process.kill()
+                job.process = None
+            job.save_render_state()
 
             # Update queue item status
-            for i in range(self.queue_list.count()):
-                item = self.queue_list.item(i)
-                widget = self.queue_list.itemWidget(item)
-                if widget and widget.file_path == self.current_blend_file:
-                    widget.label.setText(
-                        f"{os.path.basename(self.current_blend_file)} (Cancelled)"
-                    )
-                    widget.label.setStyleSheet("color: red;")
-                    break
+            self.set_queue_status(job.blend_file, "Cancelled", "red")
+        self.active_jobs.clear()
 
-            # Process next file in queue after a short delay
-            self.currently_rendering = False
-            self.current_blend_file = ""
-            self.process_next_file()
+        self.flush_blender_log()
+        self.set_cancel_button_enabled(False)
+        self.label.setText("Drag one or more Blender files here")
+        self.frame_counter.setText("Rendering cancelled.")
+
+        # Process next file in queue after a short delay
+        self.process_next_file()
+
+    def flush_blender_log(self):
+        for handler in self.blender_log.handlers:
+            handler.flush()
 
     def format_time_short(self, seconds):
         """Format time in a compact way for the queue list display"""
@@ -913,12 +1686,16 @@ exit()
         else:
             return f"{secs} seconds"
 
-    def log_error(self, blend_file, error_message):
-        """Create a log file next to the scene file with error details"""
+    def log_error(self, blend_file, error_message, error=None):
+        """Create a log file next to the scene file with error details
+
+        Pass the exception as error when it was raised on another thread, so
+        its stack trace is logged instead of the (empty) current one.
+        """
         try:
             # Generate log filename based on scene filename
-            scene_dir = os.path.dirname(blend_file)
-            scene_basename = Path(blend_file).stem
+            scene_dir, scene_name = os.path.split(blend_file)
+            scene_basename = os.path.splitext(scene_name)[0]
             log_file = os.path.join(scene_dir, f"{scene_basename}.log")
 
             # Get timestamp for the log
@@ -926,16 +1703,24 @@ exit()
 
             # Create log content with error details
             log_content = [
-                f"Error Log for {os.path.basename(blend_file)}",
+                f"Error Log for {scene_name}",
                 f"Date: {timestamp}",
                 f"Error: {error_message}",
-                "Stack Trace:",
-                traceback.format_exc(),
             ]
+            # Errors like repeated crashes aren't raised, so there may be no trace
+            if error is not None:
+                stack_trace = traceback.format_exception(error)
+            elif sys.exc_info()[0] is not None:
+                stack_trace = [traceback.format_exc()]
+            else:
+                stack_trace = []
+            if stack_trace:
+                log_content.append("Stack Trace:")
 
-            # Write to log file
+            # Write to log file, letting the file buffer collect the pieces
             with open(log_file, "w") as f:
-                f.write("\n".join(log_content))
+                f.writelines(f"{line}\n" for line in log_content)
+                f.writelines(stack_trace)
 
             print(f"Error log written to: {log_file}")
         except Exception as e:
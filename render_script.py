@@ -1,7 +1,7 @@
 import bpy
 import sys
 import os
-import re
+from itertools import groupby
 
 # -------------------------------------
 # Parse CLI arguments passed after '--'
@@ -17,6 +17,9 @@ else:
 output_dir = None
 filename_prefix = "frame_"
 resume = False
+first_frame = None  # Frame to resume from, as worked out by the GUI
+persistent_data = False
+cycles_device = None  # GPU backend for Cycles, e.g. CUDA, OPTIX, HIP, METAL, ONEAPI
 missing_frames = None  # New parameter for explicit list of frames to render
 
 # Argument parser
@@ -31,6 +34,15 @@ while i < len(args):
     elif args[i] == "--resume":
         resume = args[i + 1].lower() == "true"
         i += 2
+    elif args[i] == "--start_frame":
+        first_frame = int(args[i + 1])
+        i += 2
+    elif args[i] == "--persistent_data":
+        persistent_data = args[i + 1].lower() == "true"
+        i += 2
+    elif args[i] == "--cycles_device":
+        cycles_device = args[i + 1].upper()
+        i += 2
     elif args[i] == "--missing_frames":  # Handle new parameter
         try:
             missing_frames = [int(f) for f in args[i + 1].split(",")]
@@ -65,6 +77,11 @@ end_frame = scene.frame_end
 # -------------------------------------
 # Resume logic
 # -------------------------------------
+# List the output folder once; the resume scan and the per-frame skip check
+# both use this set instead of touching the disk again
+with os.scandir(output_dir) as entries:
+    existing_files = {entry.name for entry in entries if entry.name.endswith(".png")}
+
 # If we were provided with specific missing frames, use those
 if missing_frames:
     print(f"[INFO] Will render {len(missing_frames)} specific frames")
@@ -75,16 +92,19 @@ if missing_frames:
     end_frame = max(frames_to_render)
 else:
     # Original behavior - find highest rendered frame
-    existing_files = [f for f in os.listdir(output_dir) if f.endswith(".png")]
-    frame_pattern = re.compile(rf"{re.escape(filename_prefix)}(\d+)\.png")
-
     last_rendered = 0
-    if resume:
+    if first_frame is not None:
+        # Every frame from here on that isn't on disk yet is rendered, so gaps
+        # before the newest existing frame are filled in too
+        start_frame = first_frame
+    elif resume:
+        # Names are prefix + frame number + ".png", so slice the number out
+        prefix_len = len(filename_prefix)
         for f in existing_files:
-            match = frame_pattern.match(f)
-            if match:
-                frame_num = int(match.group(1))
-                last_rendered = max(last_rendered, frame_num)
+            if f.startswith(filename_prefix):
+                digits = f[prefix_len:-4]
+                if digits.isdecimal():
+                    last_rendered = max(last_rendered, int(digits))
 
         start_frame = max(start_frame, last_rendered + 1)
         
@@ -93,6 +113,7 @@ else:
 
 if not frames_to_render:
     print(f"[INFO] All frames already rendered in {output_dir}")
+    print(f"[DONE] Nothing left to render.")
     sys.exit(0)
 
 # -------------------------------------
@@ -100,32 +121,88 @@ if not frames_to_render:
 # -------------------------------------
 scene.render.image_settings.file_format = "PNG"
 
+# Keep scene data (BVH, shaders, textures) between frames instead of rebuilding
+# it for every frame. Costs extra memory, so it is only enabled on request
+if persistent_data:
+    scene.render.use_persistent_data = True
+
+# With factory settings, or preferences without a GPU compute backend, a scene
+# set to render on the GPU would quietly fall back to the CPU
+if cycles_device and scene.render.engine == "CYCLES":
+    try:
+        cycles_prefs = bpy.context.preferences.addons["cycles"].preferences
+        cycles_prefs.compute_device_type = cycles_device
+        cycles_prefs.refresh_devices()
+        # The device list holds entries for every backend, so only use the
+        # devices of the requested one
+        gpu_devices = [d for d in cycles_prefs.devices if d.type == cycles_device]
+        for device in cycles_prefs.devices:
+            device.use = device.type == cycles_device
+        if gpu_devices:
+            scene.cycles.device = "GPU"
+            print(f"[INFO] Rendering on {cycles_device}: {', '.join(d.name for d in gpu_devices)}")
+        else:
+            print(f"[WARNING] No {cycles_device} devices found, rendering on the CPU")
+    except (KeyError, TypeError, AttributeError) as e:
+        print(f"[WARNING] Could not enable {cycles_device} rendering: {e}")
+
 # -------------------------------------
-# Frame-by-frame rendering
+# Rendering
 # -------------------------------------
 print(f"[INFO] Starting render: {len(frames_to_render)} frames to render")
 print(f"[INFO] Output path: {output_dir}")
 print(f"[INFO] Filename prefix: {filename_prefix}")
 print(f"[INFO] Resume enabled: {resume}")
+print(f"[INFO] Persistent data: {persistent_data}")
+
+# Drop the frames that already exist up front, reporting them with one line
+# rather than one per frame
+frames_pending = [
+    frame
+    for frame in frames_to_render
+    if f"{filename_prefix}{frame:05d}.png" not in existing_files
+]
+skipped = len(frames_to_render) - len(frames_pending)
+if skipped:
+    print(f"[SKIP] {skipped} frames already exist, skipping them...")
+
+# Render each run of consecutive frames as one animation render, so Blender
+# prepares the render once per run instead of once per frame. The ##### in the
+# path is replaced by the zero-padded frame number, matching the names above.
+# Every frame in the range is rendered, as before, whatever the scene's step
+scene.frame_step = 1
+scene.render.use_overwrite = False
+output_base = os.path.join(output_dir, filename_prefix)
+for _, run in groupby(enumerate(frames_pending), key=lambda item: item[1] - item[0]):
+    run = [frame for _, frame in run]
+
+    if len(run) == 1:
+        frame = run[0]
+        output_stem = f"{output_base}{frame:05d}"
+        full_output_path = f"{output_stem}.png"
+
+        scene.frame_set(frame)
+        scene.render.filepath = output_stem
+
+        print(f"[RENDER] Frame {frame}/{end_frame} → {full_output_path}")
 
-for frame in frames_to_render:
-    padded = str(frame).zfill(5)
-    output_filename = f"{filename_prefix}{padded}.png"
-    full_output_path = os.path.join(output_dir, output_filename)
-
-    if os.path.exists(full_output_path):
-        print(f"[SKIP] Frame {frame} already exists, skipping...")
+        try:
+            bpy.ops.render.render(write_still=True)
+        except Exception as e:
+            print(f"[ERROR] Rendering failed at frame {frame}: {e}")
+            sys.exit(1)
         continue
 
-    scene.frame_set(frame)
-    scene.render.filepath = os.path.join(output_dir, f"{filename_prefix}{padded}")
+    scene.frame_start = run[0]
+    scene.frame_end = run[-1]
+    scene.render.filepath = f"{output_base}#####"
 
-    print(f"[RENDER] Frame {frame}/{end_frame} → {full_output_path}")
+    print(f"[RENDER] Frames {run[0]}-{run[-1]}/{end_frame} → {output_dir}")
 
     try:
-        bpy.ops.render.render(write_still=True)
+        bpy.ops.render.render(animation=True)
     except Exception as e:
-        print(f"[ERROR] Rendering failed at frame {frame}: {e}")
+        print(f"[ERROR] Rendering failed in frames {run[0]}-{run[-1]}: {e}")
         sys.exit(1)
 
 print(f"[DONE] Rendering completed.")